@@ -11,14 +11,26 @@ from __future__ import annotations
 import argparse
 import ast
 import fnmatch
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 import yaml
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "import_exceptions.yaml"
+# Below this many files, process start-up costs more than parsing serially.
+PARALLEL_FILE_THRESHOLD = 32
+PARALLEL_CHUNKSIZE = 16
+# Source reads block on I/O and release the GIL, so they are prefetched with threads.
+MAX_READ_THREADS = 32
+
+# Per-process state installed by _init_worker for ProcessPoolExecutor workers.
+_WORKER_CONFIG: Optional["ImportGuardConfig"] = None
+_WORKER_STDLIB: frozenset[str] = frozenset()
 
 
 class ImportGuardConfig:
@@ -57,45 +69,56 @@ class ImportGuardConfig:
         path_scoped = data.get("files", {})
         return cls(modules, path_scoped)
 
-    def is_allowed(self, module: str, file_path: Path) -> bool:
-        """Return True when a module is allow-listed for the given file path."""
+    def is_allowed(self, module: str, resolved_path: Path) -> bool:
+        """Return True when a module is allow-listed for the given file path.
+
+        Args:
+            module: Imported module name (dotted names are canonicalized).
+            resolved_path: File path already passed through ``Path.resolve()``;
+                callers resolve once per file rather than once per import.
+        """
         canonical_module = canonicalize_module_name(module)
         if canonical_module in self.module_allowlist:
             return True
 
-        resolved = file_path.resolve()
-
         # Check exact path matches (backward compatibility)
-        modules = self.path_scoped_allowlist.get(resolved)
+        modules = self.path_scoped_allowlist.get(resolved_path)
         if modules and canonical_module in modules:
             return True
 
-        for parent in resolved.parents:
+        for parent in resolved_path.parents:
             modules = self.path_scoped_allowlist.get(parent)
             if modules and canonical_module in modules:
                 return True
 
-        # Check pattern matches
-        # Convert resolved path to relative path from current working directory for pattern matching
-        try:
-            rel_path = str(resolved.relative_to(Path.cwd()))
-        except ValueError:
-            # If file is not relative to cwd, use full path
-            rel_path = str(resolved)
-
-        for pattern, modules in self.pattern_scoped_allowlist.items():
-            if canonical_module in modules:
-                # Check if the file path matches the pattern
-                if fnmatch.fnmatch(rel_path, pattern):
-                    return True
-                # Also check parent directories in the path
-                path_parts = rel_path.split("/")
-                for i in range(len(path_parts)):
-                    partial_path = "/".join(path_parts[: i + 1])
-                    if fnmatch.fnmatch(partial_path, pattern):
-                        return True
-
-        return False
+        # Check pattern matches against the path and each of its parent prefixes
+        patterns = [
+            pattern
+            for pattern, allowed_modules in self.pattern_scoped_allowlist.items()
+            if canonical_module in allowed_modules
+        ]
+        if not patterns:
+            return False
+
+        candidates = _pattern_match_candidates(resolved_path, Path.cwd())
+        return any(fnmatch.fnmatch(candidate, pattern) for pattern in patterns for candidate in candidates)
+
+
+@lru_cache(maxsize=4096)
+def _pattern_match_candidates(resolved_path: Path, cwd: Path) -> tuple[str, ...]:
+    """Return each leading prefix of the cwd-relative path, ending with the full path.
+
+    Cached because every top-level import in a file is matched against the same
+    candidates.
+    """
+    try:
+        rel_path = str(resolved_path.relative_to(cwd))
+    except ValueError:
+        # If file is not relative to cwd, use full path
+        rel_path = str(resolved_path)
+
+    path_parts = rel_path.split("/")
+    return tuple("/".join(path_parts[: i + 1]) for i in range(len(path_parts)))
 
 
 def canonicalize_module_name(name: str) -> str:
@@ -103,6 +126,32 @@ def canonicalize_module_name(name: str) -> str:
     return name.split(".")[0]
 
 
+def _walk_py(root: Path) -> list[Path]:
+    """Return Python files under a directory, pruning hidden entries before descending.
+
+    Uses ``os.scandir`` so file/directory classification comes from the directory
+    entry itself instead of an extra ``stat`` per path.
+    """
+    python_files: list[Path] = []
+    stack = [os.fspath(root)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    # Like rglob, descend only into real directories but match symlinked files.
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        python_files.append(Path(entry.path))
+        except OSError:
+            continue
+
+    return python_files
+
+
 def discover_python_files(paths: Sequence[str]) -> list[Path]:
     """Collect Python files from individual files or by walking directories."""
     python_files: list[Path] = []
@@ -115,28 +164,57 @@ def discover_python_files(paths: Sequence[str]) -> list[Path]:
         if path.is_file() and path.suffix == ".py":
             python_files.append(path)
         elif path.is_dir():
-            for candidate in path.rglob("*.py"):
-                if any(part.startswith(".") for part in candidate.parts):
-                    continue
-                python_files.append(candidate)
+            python_files.extend(_walk_py(path))
 
     return python_files
 
 
 @lru_cache(maxsize=1)
 def build_stdlib_index() -> frozenset[str]:
-    """Return a set containing names of standard-library modules."""
-    candidates: set[str] = set(sys.builtin_module_names)
-    candidates.update(canonicalize_module_name(name) for name in sys.stdlib_module_names)
-    return frozenset(candidates)
+    """Return a set containing names of standard-library modules.
+
+    ``sys.stdlib_module_names`` (Python 3.10+) already holds top-level names only,
+    so no filesystem scan or per-name canonicalization is needed.
+    """
+    return frozenset(sys.stdlib_module_names).union(sys.builtin_module_names)
+
+
+# Statement-bearing fields per node type. Imports are statements, so expression
+# subtrees (calls, comparisons, assignments' values, ...) never need visiting.
+_STATEMENT_BLOCK_FIELDS: dict[type[ast.AST], tuple[str, ...]] = {
+    ast.Module: ("body",),
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+    ast.Try: ("body", "handlers", "orelse", "finalbody"),
+    ast.TryStar: ("body", "handlers", "orelse", "finalbody"),
+    ast.ExceptHandler: ("body",),
+    ast.Match: ("cases",),
+    ast.match_case: ("body",),
+}
 
 
 class TopLevelImportVisitor(ast.NodeVisitor):
     """Collect absolute imports that appear at module scope."""
 
     def __init__(self) -> None:
-        """Initialize storage for discovered imports."""
+        """Initialize storage for discovered imports and the node dispatch table."""
         self.imports: list[tuple[str, int]] = []
+        # Replaces NodeVisitor's per-node getattr(self, "visit_" + class name) lookup.
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        """Dispatch on the node's exact type, falling back to generic_visit."""
+        self._dispatch.get(type(node), self.generic_visit)(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Don't descend into functions."""
@@ -162,9 +240,10 @@ class TopLevelImportVisitor(ast.NodeVisitor):
             self.imports.append((canonicalize_module_name(node.module), node.lineno))
 
     def generic_visit(self, node: ast.AST) -> None:
-        """Continue walking child nodes unless blocked by other handlers."""
-        for child in ast.iter_child_nodes(node):
-            self.visit(child)
+        """Continue walking nested statement blocks; other children cannot hold imports."""
+        for field in _STATEMENT_BLOCK_FIELDS.get(type(node), ()):
+            for child in getattr(node, field):
+                self.visit(child)
 
 
 def extract_top_level_imports(node: ast.AST) -> Iterable[tuple[str, int]]:
@@ -174,28 +253,81 @@ def extract_top_level_imports(node: ast.AST) -> Iterable[tuple[str, int]]:
     return visitor.imports
 
 
-def check_imports(files: Sequence[Path], config: ImportGuardConfig, *, quiet: bool = False) -> int:
-    """Validate import style across a collection of Python files."""
-    stdlib_modules = build_stdlib_index()
-    violations: list[str] = []
+def _read_source(file_path: Path) -> tuple[Path, bytes]:
+    """Resolve a file path and read its raw bytes."""
+    resolved_path = file_path.resolve()
+    return resolved_path, resolved_path.read_bytes()
 
-    for file_path in files:
-        resolved_path = file_path.resolve()
-        try:
-            with resolved_path.open("r", encoding="utf-8") as handle:
-                tree = ast.parse(handle.read(), filename=str(resolved_path))
-        except SyntaxError as exc:
-            violations.append(f"{resolved_path}: failed to parse ({exc})")
+
+def _check_file(
+    resolved_path: Path, source: bytes, config: ImportGuardConfig, stdlib_modules: frozenset[str]
+) -> list[str]:
+    """Return violation messages for a single, already-read Python file."""
+    try:
+        # ast.parse decodes bytes itself (honouring PEP 263 cookies); type comments are never inspected.
+        tree = ast.parse(source, filename=str(resolved_path), type_comments=False)
+    except SyntaxError as exc:
+        return [f"{resolved_path}: failed to parse ({exc})"]
+
+    violations: list[str] = []
+    for module_name, lineno in extract_top_level_imports(tree):
+        if module_name in stdlib_modules:
+            continue
+        if config.is_allowed(module_name, resolved_path):
             continue
+        violations.append(
+            f"{resolved_path}:{lineno} imports non-stdlib module '{module_name}' at top level",
+        )
+    return violations
+
+
+def _init_worker(payload: bytes) -> None:
+    """Install the shared config and stdlib index once per worker process.
+
+    Args:
+        payload: ``pickle.dumps((config, stdlib_modules))`` produced once by the
+            parent, so the large stdlib frozenset is serialized a single time
+            no matter how many workers are started.
+    """
+    global _WORKER_CONFIG, _WORKER_STDLIB
+    _WORKER_CONFIG, _WORKER_STDLIB = pickle.loads(payload)
+
+
+def _check_file_in_worker(job: tuple[Path, bytes]) -> list[str]:
+    """Check one prefetched file using the state installed by _init_worker."""
+    assert _WORKER_CONFIG is not None, "_init_worker must run before _check_file_in_worker"
+    resolved_path, source = job
+    return _check_file(resolved_path, source, _WORKER_CONFIG, _WORKER_STDLIB)
+
+
+def check_imports(files: Sequence[Path], config: ImportGuardConfig, *, quiet: bool = False) -> int:
+    """Validate import style across a collection of Python files.
+
+    Sources are read concurrently with a thread pool and files that never mention
+    ``import`` are skipped without parsing. The rest are parsed in a process pool
+    when there are at least PARALLEL_FILE_THRESHOLD of them, otherwise serially.
+    """
+    if not files:
+        return 0
+
+    stdlib_modules = build_stdlib_index()
 
-        for module_name, lineno in extract_top_level_imports(tree):
-            if module_name in stdlib_modules:
-                continue
-            if config.is_allowed(module_name, resolved_path):
-                continue
-            violations.append(
-                f"{resolved_path}:{lineno} imports non-stdlib module '{module_name}' at top level",
-            )
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_THREADS, len(files))) as reader:
+        # Both `import x` and `from x import y` contain the keyword, so files
+        # without it cannot violate the guard and are never parsed.
+        sources = [(path, source) for path, source in reader.map(_read_source, files) if b"import" in source]
+
+    if len(sources) < PARALLEL_FILE_THRESHOLD:
+        results = [_check_file(path, source, config, stdlib_modules) for path, source in sources]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(pickle.dumps((config, stdlib_modules), protocol=pickle.HIGHEST_PROTOCOL),),
+        ) as executor:
+            results = list(executor.map(_check_file_in_worker, sources, chunksize=PARALLEL_CHUNKSIZE))
+
+    violations = [entry for file_violations in results for entry in file_violations]
 
     if violations:
         for entry in violations:
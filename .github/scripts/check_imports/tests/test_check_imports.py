@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import ast
+import sys
 import tempfile
 from pathlib import Path
 
@@ -210,6 +211,20 @@ class TestDiscoverPythonFiles:
             assert len(files) == 1
             assert files[0].name == "visible.py"
 
+    def test_discover_symlinked_files(self):
+        """Test that symlinked Python files are discovered, as with rglob."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            outside = tmpdir_path / "outside"
+            outside.mkdir()
+            (outside / "real.py").write_text("import pandas\n")
+            root = tmpdir_path / "root"
+            (root / "sub").mkdir(parents=True)
+            (root / "sub" / "linked.py").symlink_to(outside / "real.py")
+
+            files = discover_python_files([str(root)])
+            assert files == [root / "sub" / "linked.py"]
+
     def test_multiple_paths(self):
         """Test discovering files from multiple paths."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -296,6 +311,25 @@ class Foo:
         assert len(import_list) == 1
         assert ("os", 2) in import_list
 
+    def test_imports_in_module_level_blocks_recorded(self):
+        """Test that imports nested in module-level if/try/with/match blocks are recorded."""
+        code = """
+if True:
+    import pandas
+try:
+    import numpy
+except ImportError:
+    import scipy
+with open(__file__):
+    import yaml
+match 1:
+    case 1:
+        import requests
+"""
+        tree = ast.parse(code)
+        modules = {module for module, _ in extract_top_level_imports(tree)}
+        assert modules == {"pandas", "numpy", "scipy", "yaml", "requests"}
+
 
 class TestBuildStdlibIndex:
     """Test the build_stdlib_index function."""
@@ -401,6 +435,19 @@ def foo():
         finally:
             file_path.unlink()
 
+    def test_files_without_imports_are_not_parsed(self):
+        """Test that files with no import keyword are skipped before parsing."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write("this is not valid python\n")
+            file_path = Path(f.name)
+
+        try:
+            config = ImportGuardConfig()
+            result = check_imports([file_path], config, quiet=True)
+            assert result == 0
+        finally:
+            file_path.unlink()
+
     def test_path_scoped_allowlist(self):
         """Test path-scoped allowlists work correctly."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -416,6 +463,28 @@ def foo():
             result = check_imports([test_file], config, quiet=True)
             assert result == 0
 
+    def test_parallel_matches_serial(self, monkeypatch, capsys):
+        """Test that the process pool path reports the same violations as the serial path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir).resolve()
+            files = []
+            for i in range(4):
+                file_path = tmpdir_path / f"module_{i}.py"
+                file_path.write_text("import os\nimport pandas\n" if i % 2 else "import os\n")
+                files.append(file_path)
+            config = ImportGuardConfig()
+
+            serial_result = check_imports(files, config, quiet=True)
+            serial_err = capsys.readouterr().err
+
+            monkeypatch.setattr(sys.modules[check_imports.__module__], "PARALLEL_FILE_THRESHOLD", 0)
+            parallel_result = check_imports(files, config, quiet=True)
+            parallel_err = capsys.readouterr().err
+
+            assert serial_result == parallel_result == 1
+            assert parallel_err == serial_err
+            assert parallel_err.count("pandas") == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,17 +1,102 @@
 """Asset discovery utilities for KFP components and pipelines."""
 
-from collections.abc import Sequence
+import os
+import warnings
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 _COMPONENT_FILENAME = "component.py"
 _PIPELINE_FILENAME = "pipeline.py"
+_EXAMPLE_PIPELINES_FILENAME = "example_pipelines.py"
+_TESTS_DIRNAME = "tests"
+# Non-hidden directories that never contain repository sources; hidden ones
+# (.git, .venv, ...) are already pruned by name.
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
 _RESERVED_SUBDIRS = {"tests", "shared"}
+_ASSET_ROOT_DIRS = frozenset({"components", "pipelines"})
 
 
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
-    """Get the repository root directory."""
-    return Path(__file__).resolve().parents[2]
+    """Get the repository root directory.
+
+    The location never changes within a process, so the result is cached. The
+    path is still resolved, since callers compare it against resolved paths.
+    """
+    return Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))))
+
+
+def iter_tree_entries(root: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield directory entries under root depth-first, pruning hidden and build entries.
+
+    Entries come straight from ``os.scandir`` so callers can filter on
+    ``entry.name`` and the cached ``entry.is_dir()``/``entry.is_file()`` results
+    before building any ``Path`` objects. Symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk.
+
+    Yields:
+        Every file and directory entry below root, except hidden entries and
+        cache/build directories such as ``__pycache__`` and ``node_modules``.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    yield entry
+        except OSError:
+            continue
+
+
+@dataclass(frozen=True)
+class RepoIndex:
+    """Files and directories collected from a single walk of one or more roots."""
+
+    example_files: tuple[Path, ...]
+    test_dirs: tuple[Path, ...]
+
+
+@lru_cache(maxsize=8)
+def index_repo(roots: tuple[Path, ...]) -> RepoIndex:
+    """Walk the given roots once and index example_pipelines.py files and tests/ directories.
+
+    Results are memoized per roots tuple so that several discovery steps in the
+    same process share one traversal. Call ``index_repo.cache_clear()`` if the
+    tree changes while the process is running.
+
+    Args:
+        roots: Directories to walk.
+
+    Returns:
+        RepoIndex with example_pipelines.py files in walk order and tests/
+        directories sorted.
+    """
+    example_files: list[Path] = []
+    test_dirs: list[Path] = []
+
+    for root in roots:
+        for entry in iter_tree_entries(root):
+            name = entry.name
+            # Symlinked tests/ directories count, as with rglob; the walk itself does not follow them.
+            if name == _TESTS_DIRNAME:
+                if entry.is_dir():
+                    test_dirs.append(Path(entry.path))
+            elif name == _EXAMPLE_PIPELINES_FILENAME and entry.is_file():
+                example_files.append(Path(entry.path))
+
+    return RepoIndex(
+        example_files=tuple(example_files),
+        test_dirs=tuple(sorted(test_dirs)),
+    )
 
 
 def _get_default_targets() -> tuple[Path, Path]:
@@ -20,6 +105,30 @@ def _get_default_targets() -> tuple[Path, Path]:
     return repo_root / "components", repo_root / "pipelines"
 
 
+def is_member_of_pipeline_or_component(candidate: Path) -> bool:
+    """Check if a path is within the repo's components/ or pipelines/ directory.
+
+    Uses plain string prefix checks, so candidate must be an absolute path
+    spelled the same way as the repo root (e.g. as yielded by ``index_repo``).
+
+    Args:
+        candidate: Path to check.
+
+    Returns:
+        True if the path is within components/ or pipelines/, False otherwise.
+    """
+    repo_root = get_repo_root()
+    repo_prefix = str(repo_root) + os.sep
+    candidate_str = str(candidate)
+    if not candidate_str.startswith(repo_prefix):
+        warnings.warn(
+            f"Unable to determine relative path for {candidate} relative to repo root {repo_root}. Skipping.",
+        )
+        return False
+
+    return candidate_str[len(repo_prefix) :].split(os.sep, 1)[0] in _ASSET_ROOT_DIRS
+
+
 def normalize_targets(raw_paths: Sequence[str]) -> list[Path]:
     """Normalize target paths to absolute Path objects.
 
@@ -1,13 +1,20 @@
 """AST-based utilities for finding KFP decorated functions."""
 
 import ast
+import os
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from .kfp_compilation import COMPONENT_DECORATORS, PIPELINE_DECORATORS, extract_decorator_name
 
 _ALL_KFP_DECORATORS = COMPONENT_DECORATORS | PIPELINE_DECORATORS
 
+# Node fields that hold nested statement blocks (including ExceptHandler and match_case bodies).
+_STATEMENT_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
 
 @dataclass
 class BaseImageInfo:
@@ -21,18 +28,54 @@ class BaseImageInfo:
     end_col: int
 
 
+@lru_cache(maxsize=512)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """Parse a Python file, memoized on its path and stat signature.
+
+    The mtime and size arguments are only part of the cache key so that an
+    edited file is re-parsed; callers must treat the returned tree as read-only.
+    """
+    with open(path_str, "rb") as f:
+        source = f.read()
+    # Equivalent to ast.parse, minus its wrapper: the parser decodes the bytes itself.
+    return compile(source, path_str, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
 def _get_ast_tree(file_path: Path) -> ast.AST:
     """Get the parsed AST tree for a Python file.
 
+    Trees are cached per file and reused until the file's mtime or size changes.
+
     Args:
         file_path: Path to the Python file to parse.
 
     Returns:
         The parsed AST tree.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        source = f.read()
-    return ast.parse(source)
+    path_str = os.path.abspath(file_path)
+    stat_result = os.stat(path_str)
+    return _parse_cached(path_str, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _iter_function_defs(tree: ast.AST) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """Yield function definitions in the same breadth-first order as ``ast.walk``.
+
+    Decorators can only be attached to statements, so only statement blocks are
+    traversed and expression subtrees are never visited.
+
+    Args:
+        tree: The parsed AST tree.
+
+    Yields:
+        Function and async function definition nodes.
+    """
+    queue: deque[ast.AST] = deque(getattr(tree, "body", ()))
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+        for field in _STATEMENT_BLOCK_FIELDS:
+            queue.extend(getattr(node, field, ()))
 
 
 def _is_target_decorator(decorator: ast.expr, decorator_type: str) -> bool:
@@ -73,12 +116,11 @@ def find_functions_with_decorator(file_path: Path, decorator_type: str) -> list[
     tree = _get_ast_tree(file_path)
     functions: list[str] = []
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            for decorator in node.decorator_list:
-                if _is_target_decorator(decorator, decorator_type):
-                    functions.append(node.name)
-                    break
+    for node in _iter_function_defs(tree):
+        for decorator in node.decorator_list:
+            if _is_target_decorator(decorator, decorator_type):
+                functions.append(node.name)
+                break
 
     return functions
 
@@ -126,10 +168,7 @@ def get_base_image_locations(file_path: Path) -> list[BaseImageInfo]:
     tree = _get_ast_tree(file_path)
     results: list[BaseImageInfo] = []
 
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            continue
-
+    for node in _iter_function_defs(tree):
         for decorator in node.decorator_list:
             if not _is_kfp_decorator(decorator) or not isinstance(decorator, ast.Call):
                 continue
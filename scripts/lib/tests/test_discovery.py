@@ -10,6 +10,10 @@ from ..discovery import (
     discover_assets,
     find_assets_with_metadata,
     get_all_assets_with_metadata,
+    get_repo_root,
+    index_repo,
+    is_member_of_pipeline_or_component,
+    iter_tree_entries,
 )
 
 
@@ -257,6 +261,102 @@ class TestGetAllAssetsWithMetadata:
         assert "pipelines/training/ml_wf/batch" in result
 
 
+class TestIterTreeEntries:
+    """Tests for iter_tree_entries()."""
+
+    def test_yields_nested_files_and_dirs(self, tmp_path: Path):
+        """Yield files and directories at every depth."""
+        _make_component(tmp_path, "training", "my_comp")
+
+        names = {entry.name for entry in iter_tree_entries(tmp_path)}
+
+        assert names == {"components", "training", "my_comp", "component.py"}
+
+    def test_prunes_hidden_entries(self, tmp_path: Path):
+        """Skip hidden files and never descend into hidden directories."""
+        hidden_dir = tmp_path / ".cache" / "nested"
+        hidden_dir.mkdir(parents=True)
+        (hidden_dir / "example_pipelines.py").write_text("")
+        (tmp_path / ".hidden.py").write_text("")
+        (tmp_path / "visible.py").write_text("")
+
+        names = [entry.name for entry in iter_tree_entries(tmp_path)]
+
+        assert names == ["visible.py"]
+
+    def test_prunes_cache_directories(self, tmp_path: Path):
+        """Skip __pycache__ and node_modules directories entirely."""
+        for skipped in ("__pycache__", "node_modules"):
+            (tmp_path / skipped).mkdir()
+            (tmp_path / skipped / "module.py").write_text("")
+        (tmp_path / "visible.py").write_text("")
+
+        names = [entry.name for entry in iter_tree_entries(tmp_path)]
+
+        assert names == ["visible.py"]
+
+    def test_returns_nothing_for_nonexistent_root(self, tmp_path: Path):
+        """Yield nothing when the root does not exist."""
+        assert list(iter_tree_entries(tmp_path / "missing")) == []
+
+
+class TestIndexRepo:
+    """Tests for index_repo()."""
+
+    def test_indexes_examples_and_tests(self, tmp_path: Path):
+        """Collect example_pipelines.py files and tests/ dirs in one walk."""
+        comp_file = _make_component(tmp_path, "training", "my_comp")
+        example_file = comp_file.parent / "example_pipelines.py"
+        example_file.write_text("")
+        tests_dir = comp_file.parent / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_component.py").write_text("")
+        (comp_file.parent / "README.md").write_text("")
+
+        index = index_repo((tmp_path / "components",))
+
+        assert index.example_files == (example_file,)
+        assert index.test_dirs == (tests_dir,)
+
+    def test_includes_symlinked_tests_dir(self, tmp_path: Path):
+        """Record a tests/ entry that is a symlink to a directory."""
+        comp_file = _make_component(tmp_path, "training", "my_comp")
+        shared_tests = tmp_path / "shared_tests"
+        shared_tests.mkdir()
+        (shared_tests / "test_component.py").write_text("")
+        tests_link = comp_file.parent / "tests"
+        tests_link.symlink_to(shared_tests, target_is_directory=True)
+
+        index = index_repo((tmp_path / "components",))
+
+        assert index.test_dirs == (tests_link,)
+
+    def test_memoizes_per_roots(self, tmp_path: Path):
+        """Return the same index object for repeated lookups of the same roots."""
+        _make_component(tmp_path, "training", "my_comp")
+        roots = (tmp_path / "components",)
+
+        assert index_repo(roots) is index_repo(roots)
+
+
+class TestIsMemberOfPipelineOrComponent:
+    """Tests for is_member_of_pipeline_or_component()."""
+
+    def test_paths_under_asset_roots(self):
+        """Accept paths under components/ or pipelines/ and reject other repo paths."""
+        repo_root = get_repo_root()
+
+        assert is_member_of_pipeline_or_component(repo_root / "components" / "training" / "tests")
+        assert is_member_of_pipeline_or_component(repo_root / "pipelines" / "example_pipelines.py")
+        assert not is_member_of_pipeline_or_component(repo_root / "scripts" / "tests")
+        assert not is_member_of_pipeline_or_component(repo_root / "components_extra" / "tests")
+
+    def test_warns_for_paths_outside_repo(self, tmp_path: Path):
+        """Warn and reject paths that are not under the repo root."""
+        with pytest.warns(UserWarning, match="Unable to determine relative path"):
+            assert not is_member_of_pipeline_or_component(tmp_path / "components" / "tests")
+
+
 class TestBuildComponentAsset:
     """Tests for build_component_asset()."""
 
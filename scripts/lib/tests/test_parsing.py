@@ -1,10 +1,11 @@
 """Tests for parsing module."""
 
+import textwrap
 from pathlib import Path
 
 import pytest
 
-from ..parsing import get_base_image_locations
+from ..parsing import _get_ast_tree, find_functions_with_decorator, get_base_image_locations
 from . import copy_fixture
 
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
@@ -134,3 +135,105 @@ class TestGetBaseImageLocations:
         source = file_path.read_text()
         lines = source.splitlines()
         assert lines[bi.start_line - 1][bi.start_col] == "'"
+
+
+class TestFindFunctionsWithDecorator:
+    """Tests for find_functions_with_decorator function."""
+
+    def test_finds_functions_in_nested_statement_blocks(self, tmp_path: Path):
+        """Test that decorated functions inside if/try/class/function bodies are found in walk order."""
+        file_path = tmp_path / "example_pipelines.py"
+        file_path.write_text(
+            textwrap.dedent(
+                """
+                from kfp import dsl
+
+                @dsl.pipeline(name="top")
+                def top_pipeline():
+                    @dsl.pipeline
+                    def inner_pipeline():
+                        pass
+
+                if True:
+                    @dsl.pipeline
+                    def conditional_pipeline():
+                        pass
+
+                try:
+                    pass
+                except ImportError:
+                    @dsl.pipeline
+                    def fallback_pipeline():
+                        pass
+
+                class Holder:
+                    @dsl.pipeline
+                    def method_pipeline(self):
+                        pass
+
+                @dsl.component
+                def not_a_pipeline():
+                    pass
+                """
+            )
+        )
+
+        functions = find_functions_with_decorator(file_path, "pipeline")
+
+        assert functions == [
+            "top_pipeline",
+            "inner_pipeline",
+            "conditional_pipeline",
+            "method_pipeline",
+            "fallback_pipeline",
+        ]
+
+    def test_try_handlers_visited_before_else(self, tmp_path: Path):
+        """Test that except handlers are visited before else/finally blocks, as in ast.walk."""
+        file_path = tmp_path / "example_pipelines.py"
+        file_path.write_text(
+            textwrap.dedent(
+                """
+                from kfp import dsl
+
+                try:
+                    pass
+                except ImportError:
+                    @dsl.pipeline
+                    def handler_pipeline():
+                        pass
+                else:
+                    if True:
+                        @dsl.pipeline
+                        def else_pipeline():
+                            pass
+                """
+            )
+        )
+
+        functions = find_functions_with_decorator(file_path, "pipeline")
+
+        assert functions == ["handler_pipeline", "else_pipeline"]
+
+
+class TestGetAstTree:
+    """Tests for the cached _get_ast_tree helper."""
+
+    def test_reuses_tree_for_unchanged_file(self, tmp_path: Path):
+        """Test that repeated lookups of an unchanged file return the cached tree."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text("x = 1\n")
+
+        assert _get_ast_tree(file_path) is _get_ast_tree(file_path)
+
+    def test_reparses_modified_file(self, tmp_path: Path):
+        """Test that a modified file is parsed again rather than served from cache."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text("x = 1\n")
+        first = _get_ast_tree(file_path)
+
+        file_path.write_text("x = 1\ny = 2\n")
+        second = _get_ast_tree(file_path)
+
+        assert second is not first
+        assert len(second.body) == 2
@@ -8,14 +8,12 @@ pipeline paths and runs pytest with a two-minute timeout per test.
 from __future__ import annotations
 
 import argparse
+import os
 import sys
-import warnings
 from pathlib import Path
 from typing import List, Sequence
 
-import pytest
-
-from ..lib.discovery import get_repo_root, normalize_targets
+from ..lib.discovery import get_repo_root, index_repo, is_member_of_pipeline_or_component, normalize_targets
 
 REPO_ROOT = get_repo_root()
 TIMEOUT_SECONDS = 120
@@ -69,43 +67,31 @@ def discover_test_dirs(targets: Sequence[Path]) -> List[Path]:
 
     for target in targets:
         search_root = target if target.is_dir() else target.parent
-        if not search_root.exists():
-            continue
-
-        # Direct tests/ folder
-        direct = search_root / "tests"
-        if direct.is_dir() and _is_member_of_pipeline_or_component(direct):
-            if direct not in discovered:
-                discovered.append(direct)
-        else:
-            # Broader target (category, subcategory, or repo root) –
-            # recurse to find all nested tests/ directories.
-            for tests_dir in sorted(search_root.rglob("tests")):
-                if tests_dir.is_dir() and _is_member_of_pipeline_or_component(tests_dir):
-                    if tests_dir not in discovered:
-                        discovered.append(tests_dir)
+
+        for tests_dir in index_repo((search_root,)).test_dirs:
+            if tests_dir in discovered or _is_inside_discovered(tests_dir, discovered):
+                continue
+            if is_member_of_pipeline_or_component(tests_dir):
+                discovered.append(tests_dir)
 
     return discovered
 
 
-def _is_member_of_pipeline_or_component(candidate: Path) -> bool:
-    """Check if a path is within components/ or pipelines/ directory.
+def _is_inside_discovered(candidate: Path, discovered: Sequence[Path]) -> bool:
+    """Check if a tests/ directory is nested in one already selected.
+
+    pytest already recurses into nested tests/ directories, so passing them
+    separately would only collect the same tests twice.
 
     Args:
-        candidate: Path to check.
+        candidate: tests/ directory to check.
+        discovered: tests/ directories selected so far.
 
     Returns:
-        True if the path is within components/ or pipelines/, False otherwise.
+        True if candidate lies below any discovered directory.
     """
-    try:
-        relative = candidate.relative_to(REPO_ROOT)
-    except ValueError:
-        warnings.warn(
-            f"Unable to determine relative path for {candidate} relative to repo root {REPO_ROOT}. Skipping.",
-        )
-        return False
-
-    return relative.parts and relative.parts[0] in {"components", "pipelines"}
+    candidate_str = str(candidate)
+    return any(candidate_str.startswith(str(directory) + os.sep) for directory in discovered)
 
 
 def build_pytest_args(
@@ -157,6 +143,9 @@ def main() -> int:
         verbose=args.verbose,
     )
 
+    # Imported here so that importing this module for discovery does not load pytest.
+    import pytest
+
     exit_code = pytest.main(pytest_args)
     if exit_code == 0:
         print("✅ Pytest completed successfully.")
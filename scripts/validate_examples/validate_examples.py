@@ -4,21 +4,32 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import tempfile
 import traceback
-import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
-from typing import List, Sequence, Tuple
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
-from kfp import compiler
-
-from ..lib.discovery import get_repo_root, normalize_targets
+from ..lib.discovery import get_repo_root, index_repo, is_member_of_pipeline_or_component, normalize_targets
 from ..lib.kfp_compilation import load_module_from_path as _load_module
 from ..lib.parsing import find_pipeline_functions
 
+if TYPE_CHECKING:
+    from kfp import compiler
+
 REPO_ROOT = get_repo_root()
+# Compiler holds no per-pipeline state, so one instance serves every compilation.
+# Created on first use so importing this module (e.g. for --help) skips the kfp stack.
+_COMPILER: Optional[compiler.Compiler] = None
+# Up to this many pipelines are compiled in-process; process start-up would dominate.
+SERIAL_PIPELINE_LIMIT = 2
+
+# Scratch directory handed to each compilation worker by _init_worker.
+_WORKER_SCRATCH_DIR: Optional[str] = None
 
 
 def parse_args() -> argparse.Namespace:
@@ -55,23 +66,11 @@ def discover_example_files(targets: Sequence[Path]) -> List[Path]:
         List of discovered example_pipelines.py file paths.
     """
     discovered: List[Path] = []
+    search_roots = tuple(target if target.is_dir() else target.parent for target in targets)
 
-    for target in targets:
-        search_root = target if target.is_dir() else target.parent
-
-        for candidate in search_root.rglob("example_pipelines.py"):
-            if candidate in discovered or not candidate.is_file():
-                continue
-            try:
-                relative = candidate.relative_to(REPO_ROOT)
-            except ValueError:
-                warnings.warn(
-                    f"Unable to determine relative path for {candidate} "
-                    f"relative to repo root {REPO_ROOT}. Skipping.",
-                )
-                continue
-            if relative.parts and relative.parts[0] in {"components", "pipelines"}:
-                discovered.append(candidate)
+    for candidate in index_repo(search_roots).example_files:
+        if candidate not in discovered and is_member_of_pipeline_or_component(candidate):
+            discovered.append(candidate)
 
     return discovered
 
@@ -79,6 +78,10 @@ def discover_example_files(targets: Sequence[Path]) -> List[Path]:
 def load_module_from_path(module_path: Path) -> ModuleType:
     """Load a Python module from a file path.
 
+    Modules are memoized per resolved path, so each example module (and its
+    @dsl.pipeline decorators) executes at most once per process, including in
+    compilation workers that handle several pipelines from the same module.
+
     Args:
         module_path: Path to the Python file to load.
 
@@ -88,10 +91,16 @@ def load_module_from_path(module_path: Path) -> ModuleType:
     Raises:
         ImportError: If the module cannot be loaded.
     """
-    relative = module_path.relative_to(REPO_ROOT)
+    return _load_example_module(str(module_path.resolve()))
+
+
+@lru_cache(maxsize=None)
+def _load_example_module(resolved_path: str) -> ModuleType:
+    """Load an example module by resolved path; failures are not cached."""
+    relative = Path(resolved_path).relative_to(REPO_ROOT)
     sanitized = "_".join(relative.with_suffix("").parts)
     module_name = f"example_pipelines__{sanitized}"
-    return _load_module(str(module_path), module_name)
+    return _load_module(resolved_path, module_name)
 
 
 def collect_pipeline_functions(module_path: Path, module: ModuleType) -> List[Tuple[str, object]]:
@@ -116,23 +125,57 @@ def collect_pipeline_functions(module_path: Path, module: ModuleType) -> List[Tu
     return pipelines
 
 
-def compile_pipeline(pipeline_callable: object, output_stub: str) -> None:
+def compile_pipeline(pipeline_callable: object, package_path: str) -> None:
     """Compile a pipeline function to a JSON package.
 
     Args:
         pipeline_callable: The pipeline function to compile.
-        output_stub: Base name for the output file (without extension).
+        package_path: Scratch ``.json`` file to write the package to; it may be
+            overwritten by later calls.
 
     Raises:
         Exception: If compilation fails.
     """
-    compiler_instance = compiler.Compiler()
-    with tempfile.TemporaryDirectory() as temp_dir:
-        package_path = Path(temp_dir) / f"{output_stub}.json"
-        compiler_instance.compile(
-            pipeline_func=pipeline_callable,
-            package_path=str(package_path),
-        )
+    global _COMPILER
+    if _COMPILER is None:
+        from kfp import compiler
+
+        _COMPILER = compiler.Compiler()
+
+    _COMPILER.compile(
+        pipeline_func=pipeline_callable,
+        package_path=package_path,
+    )
+
+
+def _try_compile(pipeline_callable: object, package_path: str) -> Optional[str]:
+    """Compile a pipeline and return the formatted traceback on failure, else None."""
+    try:
+        compile_pipeline(pipeline_callable, package_path)
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
+def _init_worker(scratch_dir: str) -> None:
+    """Record the scratch directory that compilation workers write packages to."""
+    global _WORKER_SCRATCH_DIR
+    _WORKER_SCRATCH_DIR = scratch_dir
+
+
+def _compile_in_worker(job: Tuple[Path, str]) -> Optional[str]:
+    """Re-load an example module in a worker process and compile one of its pipelines.
+
+    Pipeline callables cannot be pickled across processes, so workers receive the
+    module path and pipeline name and look the callable up themselves.
+    """
+    module_path, pipeline_name = job
+    try:
+        pipeline_callable = getattr(load_module_from_path(module_path), pipeline_name)
+    except Exception:
+        return traceback.format_exc()
+    package_path = os.path.join(_WORKER_SCRATCH_DIR or tempfile.gettempdir(), f"{os.getpid()}.json")
+    return _try_compile(pipeline_callable, package_path)
 
 
 def main() -> int:
@@ -149,25 +192,33 @@ def main() -> int:
         print("No example_pipelines.py modules found. Nothing to validate.")
         return 0
 
-    failures: List[str] = []
-    compiled: List[str] = []
-
+    jobs: List[Tuple[Path, str, object]] = []
     for module_path in example_files:
         module = load_module_from_path(module_path)
         pipelines = collect_pipeline_functions(module_path, module)
         if not pipelines:
             print(f"⚠️  {module_path.relative_to(REPO_ROOT)} exports no @dsl.pipeline functions.")
             continue
+        jobs.extend((module_path, pipeline_name, pipeline_callable) for pipeline_name, pipeline_callable in pipelines)
+
+    # Compiled packages are only needed to prove compilation succeeds, so each
+    # process overwrites a single scratch file instead of creating one per pipeline.
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        if len(jobs) <= SERIAL_PIPELINE_LIMIT:
+            package_path = os.path.join(scratch_dir, "pipeline.json")
+            results = [_try_compile(pipeline_callable, package_path) for _, _, pipeline_callable in jobs]
+        else:
+            with ProcessPoolExecutor(initializer=_init_worker, initargs=(scratch_dir,)) as executor:
+                results = list(executor.map(_compile_in_worker, [(path, name) for path, name, _ in jobs], chunksize=1))
 
-        for pipeline_name, pipeline_callable in pipelines:
-            stub_name = f"{module_path.stem}__{pipeline_name}"
-            try:
-                compile_pipeline(pipeline_callable, stub_name)
-                compiled.append(f"{module_path.relative_to(REPO_ROOT)}::{pipeline_name}")
-            except Exception:
-                tb = traceback.format_exc()
-                failure_message = f"{module_path.relative_to(REPO_ROOT)}::{pipeline_name} failed to compile:\n{tb}"
-                failures.append(failure_message)
+    failures: List[str] = []
+    compiled: List[str] = []
+    for (module_path, pipeline_name, _), tb in zip(jobs, results):
+        entry = f"{module_path.relative_to(REPO_ROOT)}::{pipeline_name}"
+        if tb is None:
+            compiled.append(entry)
+        else:
+            failures.append(f"{entry} failed to compile:\n{tb}")
 
     for entry in compiled:
         print(f"✅ Compiled {entry}")
@@ -83,6 +83,29 @@ class TestDiscoverPackages:
         assert "kfp_components.components.training" in packages
         assert "kfp_components.components.training.nested" in packages
 
+    def test_skip_tests_and_dotted_directories(self, components_training_structure: Path):
+        """Test that tests/ and dotted directories are skipped, but build/ and dist/ are not."""
+        components_dir = components_training_structure / "components"
+        for name in ("tests", ".hidden", "build", "dist"):
+            (components_dir / name).mkdir()
+            (components_dir / name / "__init__.py").write_text("")
+
+        packages = discover_packages(components_training_structure)
+        assert "kfp_components.components.tests" not in packages
+        assert "kfp_components.components..hidden" not in packages
+        assert "kfp_components.components.build" in packages
+        assert "kfp_components.components.dist" in packages
+
+    def test_discover_symlinked_packages(self, components_training_structure: Path):
+        """Test that symlinked package directories are discovered, as setuptools does."""
+        target = components_training_structure / "shared_source"
+        target.mkdir()
+        (target / "__init__.py").write_text("")
+        (components_training_structure / "components" / "linked").symlink_to(target, target_is_directory=True)
+
+        packages = discover_packages(components_training_structure)
+        assert "kfp_components.components.linked" in packages
+
 
 class TestReadPyprojectPackages:
     """Tests for read_pyproject_packages function."""
@@ -146,6 +169,45 @@ package-dir = {"kfp_components" = "."}
         packages = read_pyproject_packages(tmp_path)
         assert packages == set()
 
+    def test_dotted_key_packages(self, tmp_path: Path):
+        """Test reading packages declared with a dotted key under [tool]."""
+        pyproject_content = """
+[tool]
+setuptools.packages = ["kfp_components", "kfp_components.components"]
+"""
+        (tmp_path / "pyproject.toml").write_text(pyproject_content)
+
+        packages = read_pyproject_packages(tmp_path)
+        assert packages == {"kfp_components", "kfp_components.components"}
+
+    def test_packages_subtable_not_read_as_list(self, tmp_path: Path):
+        """Test that arrays in [tool.setuptools.*] subtables are not mistaken for packages."""
+        pyproject_content = """
+[tool.setuptools]
+zip-safe = false
+
+[tool.setuptools.packages.find]
+where = ["src"]
+"""
+        (tmp_path / "pyproject.toml").write_text(pyproject_content)
+
+        with pytest.raises(RuntimeError, match="must be a list"):
+            read_pyproject_packages(tmp_path)
+
+    def test_invalid_toml_after_packages_raises(self, tmp_path: Path):
+        """Test that syntax errors anywhere in pyproject.toml are reported."""
+        pyproject_content = """
+[tool.setuptools]
+packages = ["kfp_components"]
+
+[project
+name = "broken"
+"""
+        (tmp_path / "pyproject.toml").write_text(pyproject_content)
+
+        with pytest.raises(RuntimeError, match="Failed to parse pyproject.toml"):
+            read_pyproject_packages(tmp_path)
+
 
 class TestValidatePackageEntries:
     """Tests for validate_package_entries function."""
@@ -9,61 +9,97 @@ Usage:
     uv run python -m scripts.validate_package_entries.validate_package_entries
 """
 
-import argparse
+import os
 import sys
 import tomllib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..lib.discovery import get_repo_root
 
+# Directory names that can never be packages in the distribution. This mirrors
+# scripts/sync_packages, whose find_packages call excludes tests packages; names
+# containing a dot are not importable and are pruned separately.
+_SKIP_DIRS = frozenset({"tests", "__pycache__"})
 
-def _discover_recursive(directory: Path, base_package: str, packages: set[str]) -> None:
-    """Recursively discover packages in a directory.
+# The repo root maps to the kfp_components package; these top-level directories
+# are walked for its subpackages.
+_ROOT_PACKAGE = "kfp_components"
+_PACKAGE_ROOTS = (
+    ("components", f"{_ROOT_PACKAGE}.components"),
+    ("pipelines", f"{_ROOT_PACKAGE}.pipelines"),
+)
 
-    Args:
-        directory: Directory to search for packages.
-        base_package: Base package name (e.g., "kfp_components.components").
-        packages: Set to add discovered packages to.
-    """
-    if not directory.exists():
-        return
+# Appended to a directory path to probe for its __init__.py.
+_INIT_SUFFIX = os.sep + "__init__.py"
+
+
+def _walk_root(root: Path, top_package: str) -> set[str]:
+    """Discover a top-level package and all packages nested below it.
 
-    for item in directory.iterdir():
-        # Skip test directories
-        if item.name == "tests":
-            continue
+    Uses ``os.scandir`` so directory checks are answered from the cached dirent
+    instead of a separate ``stat`` per entry. Directories without an
+    ``__init__.py`` are not descended into. A missing root is detected from the
+    scandir error and the root's own ``__init__.py`` from its listing, so no
+    separate existence checks are needed.
 
-        if item.is_dir() and (item / "__init__.py").exists():
-            package_name = f"{base_package}.{item.name}"
-            packages.add(package_name)
+    Args:
+        root: Top-level directory (e.g., ``components/``).
+        top_package: Package name of the root (e.g., "kfp_components.components").
 
-            # Recursively discover nested packages
-            _discover_recursive(item, package_name, packages)
+    Returns:
+        Package names under the root, including top_package itself, or an empty
+        set if the root is not a package.
+    """
+    try:
+        with os.scandir(root) as entries:
+            root_entries = list(entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    if not any(entry.name == "__init__.py" and entry.is_file() for entry in root_entries):
+        return set()
+
+    # Each directory yields at most one name, so a list collects them without
+    # duplicates and the set is sized once at the end.
+    packages = [top_package]
+    pending = deque([(root_entries, top_package)])
+    while pending:
+        entries, current_package = pending.popleft()
+        for entry in entries:
+            if entry.name in _SKIP_DIRS or "." in entry.name:
+                continue
+            # Follow symlinked directories, as setuptools.find_packages does.
+            if not entry.is_dir():
+                continue
+            if not os.path.isfile(entry.path + _INIT_SUFFIX):
+                continue
+            package_name = f"{current_package}.{entry.name}"
+            packages.append(package_name)
+            with os.scandir(entry.path) as children:
+                pending.append((list(children), package_name))
+    return set(packages)
 
 
 def discover_packages(repo_root: Path) -> set[str]:
     """Discover all Python packages in components/ and pipelines/ directories.
 
     Returns a set of package names in the format kfp_components.* based on
-    the package-dir mapping in pyproject.toml.
+    the package-dir mapping in pyproject.toml. The two roots are walked in
+    parallel threads; scandir releases the GIL, so their I/O overlaps.
     """
     packages: set[str] = set()
 
     # Always include the root package
-    if (repo_root / "__init__.py").exists():
-        packages.add("kfp_components")
-
-    # Discover packages in components/
-    components_dir = repo_root / "components"
-    if components_dir.exists() and (components_dir / "__init__.py").exists():
-        packages.add("kfp_components.components")
-        _discover_recursive(components_dir, "kfp_components.components", packages)
+    if os.path.isfile(str(repo_root) + _INIT_SUFFIX):
+        packages.add(_ROOT_PACKAGE)
 
-    # Discover packages in pipelines/
-    pipelines_dir = repo_root / "pipelines"
-    if pipelines_dir.exists() and (pipelines_dir / "__init__.py").exists():
-        packages.add("kfp_components.pipelines")
-        _discover_recursive(pipelines_dir, "kfp_components.pipelines", packages)
+    with ThreadPoolExecutor(max_workers=len(_PACKAGE_ROOTS)) as executor:
+        futures = [
+            executor.submit(_walk_root, repo_root / subdir, top_package) for subdir, top_package in _PACKAGE_ROOTS
+        ]
+        for future in futures:
+            packages |= future.result()
 
     return packages
 
@@ -73,10 +109,17 @@ def read_pyproject_packages(repo_root: Path) -> set[str]:
     pyproject_path = repo_root / "pyproject.toml"
 
     try:
-        with open(pyproject_path, "rb") as f:
-            pyproject = tomllib.load(f)
+        fd = os.open(pyproject_path, os.O_RDONLY)
     except FileNotFoundError:
         raise RuntimeError(f"pyproject.toml not found at {pyproject_path}")
+    # A single read of a small file; skips the buffered/text I/O wrapper setup.
+    try:
+        text = os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+    try:
+        pyproject = tomllib.loads(text)
     except tomllib.TOMLDecodeError as e:
         raise RuntimeError(f"Failed to parse pyproject.toml: {e}") from e
 
@@ -86,10 +129,13 @@ def read_pyproject_packages(repo_root: Path) -> set[str]:
     if not isinstance(packages, list):
         raise RuntimeError("tool.setuptools.packages must be a list")
 
-    if not all(isinstance(p, str) for p in packages):
-        raise RuntimeError("All entries in tool.setuptools.packages must be strings")
+    declared: set[str] = set()
+    for package in packages:
+        if type(package) is not str:
+            raise RuntimeError("All entries in tool.setuptools.packages must be strings")
+        declared.add(package)
 
-    return set(packages)
+    return declared
 
 
 def validate_package_entries(repo_root: Path | None = None) -> tuple[bool, list[str]]:
@@ -103,6 +149,8 @@ def validate_package_entries(repo_root: Path | None = None) -> tuple[bool, list[
 
     discovered = discover_packages(repo_root)
     declared = read_pyproject_packages(repo_root)
+    if discovered == declared:
+        return True, []
 
     errors: list[str] = []
 
@@ -110,17 +158,13 @@ def validate_package_entries(repo_root: Path | None = None) -> tuple[bool, list[
     missing = discovered - declared
     if missing:
         errors.append(
-            f"Missing packages in pyproject.toml (found {len(missing)}):\n"
-            + "\n".join(f"  - {pkg}" for pkg in sorted(missing))
+            f"Missing packages in pyproject.toml (found {len(missing)}):\n  - " + "\n  - ".join(sorted(missing))
         )
 
     # Find extra packages (declared but not discovered)
     extra = declared - discovered
     if extra:
-        errors.append(
-            f"Extra packages in pyproject.toml (found {len(extra)}):\n"
-            + "\n".join(f"  - {pkg}" for pkg in sorted(extra))
-        )
+        errors.append(f"Extra packages in pyproject.toml (found {len(extra)}):\n  - " + "\n  - ".join(sorted(extra)))
 
     is_valid = len(errors) == 0
     return is_valid, errors
@@ -128,17 +172,14 @@ def validate_package_entries(repo_root: Path | None = None) -> tuple[bool, list[
 
 def main() -> int:
     """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Validate package entries in pyproject.toml",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Validate all packages
-  uv run python -m scripts.validate_package_entries.validate_package_entries
-        """,
-    )
-
-    parser.parse_args()
+    # The script takes no arguments, so argparse is not worth its import and setup cost.
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(__doc__)
+        return 0
+    if args:
+        print(f"❌ Unrecognized arguments: {' '.join(args)}", file=sys.stderr)
+        return 2
 
     try:
         is_valid, errors = validate_package_entries()